@@ -0,0 +1,104 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from .corpus import build_zbook_database, generate_records
+from .stages import peak_rss_worker
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+# 計測する合成データベースのレコード数
+CORPUS_SIZES = [500, 5000]
+
+# RSS計測プロセスの実行時間の上限（秒）
+RSS_WORKER_TIMEOUT = 600
+
+# get_cleaned_kindle_dataがload_dotenvで読み込むフィルタ設定
+FILTER_ENV_VARS = ["EXCLUDE_CONTENT_TAGS", "PURCHASE_DATE_SINCE"]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def disable_env_filters():
+    """
+    .envのフィルタ設定で計測対象の処理量が変わらないよう、フィルタを無効にする。
+
+    load_dotenvは既存の環境変数を上書きしないため、空文字を設定しておけば.envの値は使われない。
+    os.environに設定するので、RSS計測用に起動するプロセスにも引き継がれる。
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for name in FILTER_ENV_VARS:
+            mp.setenv(name, "")
+        yield
+
+
+@pytest.fixture(scope="session")
+def corpus_db(tmp_path_factory):
+    """レコード数ごとに合成ZBOOKデータベースを1度だけ作成して返す。"""
+    cache = {}
+
+    def _get(rows):
+        if rows not in cache:
+            db_path = tmp_path_factory.mktemp("corpus") / f"BookData_{rows}.sqlite"
+            cache[rows] = build_zbook_database(str(db_path), rows, seed=rows)
+        return cache[rows]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def corpus_records():
+    """corpus_dbと同じシードで生成した、各レコードの種別と期待されるメタデータを返す。"""
+    cache = {}
+
+    def _get(rows):
+        if rows not in cache:
+            cache[rows] = generate_records(rows, seed=rows)
+        return cache[rows]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def measure_peak_rss():
+    """ステージを新しいプロセスで実行し、最大RSSを計測する関数を返す。"""
+    context = multiprocessing.get_context("spawn")
+
+    def _measure(stage, db_path):
+        queue = context.Queue()
+        process = context.Process(target=peak_rss_worker, args=(stage, db_path, queue))
+        process.start()
+        try:
+            process.join(timeout=RSS_WORKER_TIMEOUT)
+            if process.exitcode is None:
+                pytest.fail(f"{stage}: RSS計測プロセスが{RSS_WORKER_TIMEOUT}秒以内に終了しませんでした。")
+            if process.exitcode != 0:
+                pytest.fail(f"{stage}: RSS計測プロセスが終了コード{process.exitcode}で異常終了しました。")
+            return queue.get(timeout=10)
+        finally:
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+    return _measure
+
+
+@pytest.fixture(scope="session")
+def allocation_baselines():
+    """
+    保存済みのメモリ確保量のベースラインを返す。
+
+    環境変数KINDLE_BENCH_UPDATE_BASELINES=1の場合は、セッション終了時に計測値でbaselines.jsonを更新する。
+    """
+    baselines = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baselines = json.load(f)
+
+    yield baselines
+
+    if os.getenv("KINDLE_BENCH_UPDATE_BASELINES") == "1":
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(baselines.items())), f, ensure_ascii=False, indent=2)
+            f.write("\n")
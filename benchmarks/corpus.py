@@ -0,0 +1,337 @@
+import argparse
+import os
+import plistlib
+import random
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, NamedTuple, Optional
+
+# 合成データに使う語彙
+AUTHORS = [
+    "夏目 漱石", "芥川 龍之介", "太宰 治", "宮沢 賢治", "村上 春樹",
+    "Martin Fowler", "Robert C. Martin", "Kent Beck", "Eric Evans", "Andrew Hunt",
+]
+PUBLISHERS = ["新潮社", "岩波書店", "講談社", "オライリー・ジャパン", "技術評論社", "翔泳社"]
+CONTENT_TAGS = ["ebook", "sample", "comic", "kindle_unlimited", "prime_reading", "audible_companion"]
+TITLE_WORDS = ["吾輩", "猫", "銀河", "鉄道", "夜", "設計", "入門", "実践", "リファクタリング", "ドメイン", "駆動"]
+
+CLASS_CHAINS = {
+    "NSMutableDictionary": ["NSMutableDictionary", "NSDictionary", "NSObject"],
+    "NSDictionary": ["NSDictionary", "NSObject"],
+    "NSMutableArray": ["NSMutableArray", "NSArray", "NSObject"],
+    "NSArray": ["NSArray", "NSObject"],
+}
+
+ZBOOK_COLUMNS = [
+    ("Z_PK", "INTEGER PRIMARY KEY"),
+    ("Z_ENT", "INTEGER"),
+    ("Z_OPT", "INTEGER"),
+    ("ZBOOKID", "VARCHAR"),
+    ("ZDISPLAYTITLE", "VARCHAR"),
+    ("ZDISPLAYAUTHOR", "VARCHAR"),
+    ("ZAUTHOR", "VARCHAR"),
+    ("ZPUBLISHER", "VARCHAR"),
+    ("ZRAWPUBLICATIONDATE", "TIMESTAMP"),
+    ("ZSYNCMETADATAATTRIBUTES", "BLOB"),
+]
+
+
+class _KeyedArchiver:
+    """Pythonのオブジェクトを NSKeyedArchiver 形式の $objects 配列に書き出す。"""
+
+    def __init__(self, dict_class: str = "NSDictionary", array_class: str = "NSArray"):
+        self.objects: List[Any] = ["$null"]
+        self.class_uids: Dict[str, plistlib.UID] = {}
+        self.string_uids: Dict[str, plistlib.UID] = {}
+        self.dict_class = dict_class
+        self.array_class = array_class
+
+    def _append(self, obj: Any) -> plistlib.UID:
+        self.objects.append(obj)
+        return plistlib.UID(len(self.objects) - 1)
+
+    def _class_uid(self, class_name: str) -> plistlib.UID:
+        if class_name not in self.class_uids:
+            self.class_uids[class_name] = self._append(
+                {"$classname": class_name, "$classes": CLASS_CHAINS[class_name]}
+            )
+        return self.class_uids[class_name]
+
+    def encode(self, value: Any) -> plistlib.UID:
+        if value is None:
+            return plistlib.UID(0)
+
+        if isinstance(value, dict):
+            # クラス参照より先に自身の領域を確保し、実データと同じくコンテナが前に来るようにする
+            uid = self._append(None)
+            keys = [self.encode(k) for k in value.keys()]
+            vals = [self.encode(v) for v in value.values()]
+            self.objects[uid.data] = {
+                "NS.keys": keys,
+                "NS.objects": vals,
+                "$class": self._class_uid(self.dict_class),
+            }
+            return uid
+
+        if isinstance(value, list):
+            uid = self._append(None)
+            items = [self.encode(v) for v in value]
+            self.objects[uid.data] = {"NS.objects": items, "$class": self._class_uid(self.array_class)}
+            return uid
+
+        if isinstance(value, str):
+            # NSKeyedArchiverと同様に同じ文字列は1つのオブジェクトを共有する
+            if value not in self.string_uids:
+                self.string_uids[value] = self._append(value)
+            return self.string_uids[value]
+
+        return self._append(value)
+
+    def archive(self, root: Any) -> bytes:
+        top = self.encode(root)
+        return plistlib.dumps(
+            {
+                "$version": 100000,
+                "$archiver": "NSKeyedArchiver",
+                "$top": {"root": top},
+                "$objects": self.objects,
+            },
+            fmt=plistlib.FMT_BINARY,
+        )
+
+
+def _random_date(rng: random.Random, start_year: int, end_year: int) -> str:
+    start = datetime(start_year, 1, 1, tzinfo=timezone.utc)
+    end = datetime(end_year, 12, 31, tzinfo=timezone.utc)
+    moment = start + timedelta(seconds=rng.randrange(int((end - start).total_seconds())))
+    return moment.strftime("%Y-%m-%dT%H:%M:%S+0000")
+
+
+def _nested_payload(rng: random.Random, depth: int) -> Optional[Dict[str, Any]]:
+    """depth段の入れ子になったダミー属性を生成する。"""
+    if depth <= 0:
+        return None
+    payload: Dict[str, Any] = {"level": str(depth), "values": [str(rng.randrange(1000)) for _ in range(rng.randint(1, 3))]}
+    child = _nested_payload(rng, depth - 1)
+    if child is not None:
+        payload["child"] = child
+    return payload
+
+
+def generate_book(rng: random.Random, index: int, max_authors: int = 3, max_tags: int = 3, max_depth: int = 3) -> Dict[str, Any]:
+    """
+    1冊分の書籍メタデータ（ZSYNCMETADATAATTRIBUTESをデコードした形）を生成する。
+
+    Args:
+        rng: 乱数生成器
+        index: 書籍の通し番号
+        max_authors: 著者数の上限
+        max_tags: コンテンツタグ数の上限
+        max_depth: 付加する入れ子属性の深さの上限
+
+    Returns:
+        Dict[str, Any]: {"attributes": {...}} 形式のメタデータ
+    """
+    authors = rng.sample(AUTHORS, rng.randint(1, max_authors))
+    tags = rng.sample(CONTENT_TAGS, rng.randint(0, max_tags))
+    title = "".join(rng.choices(TITLE_WORDS, k=rng.randint(2, 4))) + f" {index}"
+
+    attributes: Dict[str, Any] = {
+        "title": title,
+        "ASIN": f"B{index:09d}",
+        # 著者が1人の場合は文字列、複数の場合は配列になる実データの揺れを再現する
+        "authors": {"author": authors[0] if len(authors) == 1 else authors},
+        "publishers": {"publisher": rng.choice(PUBLISHERS)},
+        "purchase_date": _random_date(rng, 2015, 2025),
+        "publication_date": _random_date(rng, 1990, 2025),
+    }
+    if tags:
+        attributes["content_tags"] = {"tag": tags[0] if len(tags) == 1 else tags}
+
+    extra = _nested_payload(rng, rng.randint(0, max_depth))
+    if extra is not None:
+        attributes["extra"] = extra
+
+    return {"attributes": attributes}
+
+
+def archive_metadata(metadata: Dict[str, Any], rng: Optional[random.Random] = None) -> bytes:
+    """メタデータを NSKeyedArchive 形式のバイナリplistに変換する。"""
+    rng = rng or random.Random()
+    archiver = _KeyedArchiver(
+        dict_class=rng.choice(["NSDictionary", "NSMutableDictionary"]),
+        array_class=rng.choice(["NSArray", "NSMutableArray"]),
+    )
+    return archiver.archive(metadata)
+
+
+def malform_blob(blob: bytes, rng: random.Random) -> bytes:
+    """正常なblobから、解析に失敗する壊れたblobを作る。"""
+    kind = rng.choice(["truncated", "garbage", "not_archive", "dangling_uid"])
+    if kind == "truncated":
+        return blob[: rng.randint(1, max(1, len(blob) // 2))]
+    if kind == "garbage":
+        return bytes(rng.randrange(256) for _ in range(rng.randint(8, 256)))
+    if kind == "not_archive":
+        return plistlib.dumps({"attributes": "unexpected"}, fmt=plistlib.FMT_BINARY)
+    return plistlib.dumps(
+        {
+            "$version": 100000,
+            "$archiver": "NSKeyedArchiver",
+            "$top": {"root": plistlib.UID(9999)},
+            "$objects": ["$null"],
+        },
+        fmt=plistlib.FMT_BINARY,
+    )
+
+
+class CorpusRecord(NamedTuple):
+    """生成した1件分のblobと、その元になったメタデータ。"""
+
+    kind: str  # "valid" / "malformed" / "null"
+    metadata: Optional[Dict[str, Any]]  # validの場合のみ、blobをデコードした結果と一致する
+    blob: Optional[bytes]
+
+
+def generate_records(
+    count: int,
+    seed: int = 0,
+    malformed_rate: float = 0.05,
+    null_rate: float = 0.02,
+    max_authors: int = 3,
+    max_tags: int = 3,
+    max_depth: int = 3,
+) -> List[CorpusRecord]:
+    """
+    ZSYNCMETADATAATTRIBUTESカラムに相当するblobを、期待されるデコード結果と合わせてcount件生成する。
+
+    Args:
+        count: 生成件数
+        seed: 乱数シード
+        malformed_rate: 壊れたblobの割合
+        null_rate: NULLの割合
+        max_authors: 著者数の上限
+        max_tags: コンテンツタグ数の上限
+        max_depth: 付加する入れ子属性の深さの上限
+
+    Returns:
+        List[CorpusRecord]: 生成したレコードのリスト
+    """
+    rng = random.Random(seed)
+    records: List[CorpusRecord] = []
+    for index in range(count):
+        roll = rng.random()
+        if roll < null_rate:
+            records.append(CorpusRecord("null", None, None))
+            continue
+        metadata = generate_book(rng, index, max_authors, max_tags, max_depth)
+        blob = archive_metadata(metadata, rng)
+        if roll < null_rate + malformed_rate:
+            records.append(CorpusRecord("malformed", None, malform_blob(blob, rng)))
+        else:
+            records.append(CorpusRecord("valid", metadata, blob))
+    return records
+
+
+def generate_blobs(count: int, seed: int = 0, **options: Any) -> List[Optional[bytes]]:
+    """
+    ZSYNCMETADATAATTRIBUTESカラムに相当するblobをcount件生成する。
+
+    Args:
+        count: 生成件数
+        seed: 乱数シード
+        **options: generate_recordsに渡すオプション
+
+    Returns:
+        List[Optional[bytes]]: blobのリスト（NULLはNone）
+    """
+    return [record.blob for record in generate_records(count, seed=seed, **options)]
+
+
+def build_zbook_database(db_path: str, rows: int, seed: int = 0, overwrite: bool = False, **blob_options: Any) -> str:
+    """
+    合成データを格納したZBOOKテーブルを持つSQLiteデータベースを作成する。
+
+    Args:
+        db_path: 作成するデータベースのパス
+        rows: レコード数
+        seed: 乱数シード
+        overwrite: Trueの場合のみ既存のファイルを上書きする
+        **blob_options: generate_recordsに渡すオプション
+
+    Returns:
+        str: 作成したデータベースのパス
+
+    Raises:
+        FileExistsError: db_pathが既に存在し、overwriteがFalseの場合
+    """
+    if os.path.exists(db_path):
+        # 実際のBookData.sqliteを誤って消さないよう、明示的な指定がない限り上書きしない
+        if not overwrite:
+            raise FileExistsError(f"ファイルが既に存在します: {db_path}")
+        os.remove(db_path)
+    output_dir = os.path.dirname(os.path.abspath(db_path))
+    os.makedirs(output_dir, exist_ok=True)
+
+    blobs = generate_blobs(rows, seed=seed, **blob_options)
+    rng = random.Random(seed + 1)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        columns_sql = ", ".join(f"{name} {col_type}" for name, col_type in ZBOOK_COLUMNS)
+        conn.execute(f"CREATE TABLE ZBOOK ({columns_sql})")
+        records = []
+        for index, blob in enumerate(blobs):
+            author = rng.choice(AUTHORS)
+            records.append((
+                index + 1,
+                1,
+                1,
+                f"A:B{index:09d}-0",
+                "".join(rng.choices(TITLE_WORDS, k=3)) + f" {index}",
+                author,
+                author,
+                rng.choice(PUBLISHERS),
+                rng.uniform(0, 7e8),
+                blob,
+            ))
+        placeholders = ", ".join("?" for _ in ZBOOK_COLUMNS)
+        conn.executemany(f"INSERT INTO ZBOOK VALUES ({placeholders})", records)
+        conn.commit()
+    finally:
+        conn.close()
+
+    return db_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="合成したKindle蔵書データベース(ZBOOK)を作成します。")
+    parser.add_argument("--rows", type=int, default=1000, help="レコード数")
+    parser.add_argument("--output", type=str, default="data/SyntheticBookData.sqlite", help="出力先のパス")
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    parser.add_argument("--malformed-rate", type=float, default=0.05, help="壊れたblobの割合")
+    parser.add_argument("--max-authors", type=int, default=3, help="著者数の上限")
+    parser.add_argument("--max-tags", type=int, default=3, help="コンテンツタグ数の上限")
+    parser.add_argument("--max-depth", type=int, default=3, help="入れ子属性の深さの上限")
+    parser.add_argument("--force", action="store_true", help="出力先のファイルが既に存在する場合に上書きする")
+
+    args = parser.parse_args()
+
+    try:
+        build_zbook_database(
+            args.output,
+            args.rows,
+            seed=args.seed,
+            overwrite=args.force,
+            malformed_rate=args.malformed_rate,
+            max_authors=args.max_authors,
+            max_tags=args.max_tags,
+            max_depth=args.max_depth,
+        )
+    except FileExistsError as e:
+        parser.exit(1, f"エラー: {e} (上書きする場合は--forceを指定してください)\n")
+    print(f"{args.rows}件の合成データを'{args.output}'に作成しました。")
+
+
+if __name__ == "__main__":
+    main()
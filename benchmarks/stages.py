@@ -0,0 +1,131 @@
+import contextlib
+import io
+import resource
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.kindle_data.extractor import extract_kindle_data, resolve_ns_keyed_archive_fully
+from src.kindle_data.processor import extract_metadata_attributes, get_cleaned_kindle_data
+
+
+def _prepare_extract(db_path: str) -> str:
+    return db_path
+
+
+def _run_extract(db_path: str) -> Any:
+    return extract_kindle_data(db_path)
+
+
+def _prepare_resolve(db_path: str) -> list:
+    return extract_kindle_data(db_path)["ZSYNCMETADATAATTRIBUTES"].tolist()
+
+
+def _run_resolve(blobs: list) -> list:
+    return [resolve_ns_keyed_archive_fully(blob) for blob in blobs]
+
+
+def _prepare_metadata(db_path: str) -> Any:
+    return extract_kindle_data(db_path)
+
+
+def _run_metadata(book_df: Any) -> Any:
+    # extract_metadata_attributesは引数のDataFrameにカラムを追加するため、毎回コピーを渡す
+    return extract_metadata_attributes(book_df.copy())
+
+
+def _prepare_cleaned(db_path: str) -> str:
+    return db_path
+
+
+def _run_cleaned(db_path: str) -> Any:
+    # 結果の表示は計測対象に含めるが、ベンチマークの出力には流さない
+    with contextlib.redirect_stdout(io.StringIO()):
+        return get_cleaned_kindle_data(db_path)
+
+
+# ステージ名 → (入力の準備, 計測対象の処理)
+STAGES: Dict[str, Tuple[Callable[[str], Any], Callable[[Any], Any]]] = {
+    "extract_kindle_data": (_prepare_extract, _run_extract),
+    "resolve_ns_keyed_archive_fully": (_prepare_resolve, _run_resolve),
+    "extract_metadata_attributes": (_prepare_metadata, _run_metadata),
+    "get_cleaned_kindle_data": (_prepare_cleaned, _run_cleaned),
+}
+
+
+def _proc_status_bytes(field: str) -> Optional[int]:
+    """/proc/self/statusの値をバイト単位で返す。Linux以外ではNoneを返す。"""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _ru_maxrss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrssの単位はmacOSではバイト、Linuxではキロバイト
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _reset_peak_rss() -> None:
+    # Linuxではclear_refsに5を書き込むとVmHWMが現在のRSSにリセットされる
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _current_rss_bytes() -> int:
+    return _proc_status_bytes("VmRSS") or _ru_maxrss_bytes()
+
+
+def _peak_rss_bytes() -> int:
+    # ru_maxrssはexec後も親プロセスの値を引き継ぐため、取得できる場合はVmHWMを優先する
+    return _proc_status_bytes("VmHWM") or _ru_maxrss_bytes()
+
+
+def measure_allocations(stage: str, db_path: str) -> Dict[str, int]:
+    """
+    ステージを1回実行し、tracemallocで計測したメモリ確保量を返す。
+
+    Args:
+        stage: STAGESのキー
+        db_path: 合成データベースのパス
+
+    Returns:
+        Dict[str, int]: ピーク時の確保量(peak_bytes)と処理後も残っているブロック数(retained_blocks)
+    """
+    prepare, run = STAGES[stage]
+    data = prepare(db_path)
+
+    tracemalloc.start()
+    try:
+        result = run(data)
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+
+    retained_blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    return {"peak_bytes": peak, "retained_blocks": retained_blocks}
+
+
+def peak_rss_worker(stage: str, db_path: str, queue: Any) -> None:
+    """
+    別プロセスでステージを1回実行し、最大RSSと実行中に増えたRSSをキューに書き込む。
+
+    最大RSSはプロセス単位でしか取得できないため、ステージごとに新しいプロセスで計測する。
+    """
+    prepare, run = STAGES[stage]
+    data = prepare(db_path)
+    _reset_peak_rss()
+    before = _current_rss_bytes()
+    run(data)
+    peak = _peak_rss_bytes()
+    queue.put({"peak_rss_bytes": peak, "peak_rss_delta_bytes": max(peak - before, 0)})
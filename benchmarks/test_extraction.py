@@ -0,0 +1,107 @@
+import os
+
+import pandas as pd
+import pytest
+
+from .conftest import CORPUS_SIZES
+from .stages import STAGES, measure_allocations
+
+# ベースラインに対して許容するメモリ確保量の増加率
+ALLOCATION_TOLERANCE = float(os.getenv("KINDLE_BENCH_ALLOCATION_TOLERANCE", "0.25"))
+
+
+def _join(value):
+    # extract_metadata_attributesと同じく、配列はカンマ区切りの文字列になる
+    return ", ".join(value) if isinstance(value, list) else value
+
+
+def _expected_columns(record):
+    if record.kind != "valid":
+        return {"author": None, "asin": None, "content_tag": None}
+    attributes = record.metadata["attributes"]
+    return {
+        "author": _join(attributes["authors"]["author"]),
+        "asin": attributes["ASIN"],
+        "content_tag": _join(attributes["content_tags"]["tag"]) if "content_tags" in attributes else None,
+    }
+
+
+def _check_metadata_columns(book_df, records):
+    assert len(book_df) == len(records)
+    for (_, row), record in zip(book_df.iterrows(), records):
+        for col, expected in _expected_columns(record).items():
+            if expected is None:
+                assert pd.isna(row[col]), f"{col}: {row[col]!r} ({record.kind})"
+            else:
+                assert row[col] == expected, f"{col}: {row[col]!r} != {expected!r}"
+
+
+def _check_result(stage, result, records):
+    """ステージの出力が合成データの期待値と一致することを確認する。"""
+    if stage == "extract_kindle_data":
+        assert len(result) == len(records)
+    elif stage == "resolve_ns_keyed_archive_fully":
+        resolved = [value for value in result if isinstance(value, dict)]
+        assert len(resolved) == sum(record.kind == "valid" for record in records)
+        for value, record in zip(result, records):
+            if record.kind == "valid":
+                assert value == record.metadata
+            else:
+                assert pd.isna(value)
+    else:
+        _check_metadata_columns(result, records)
+
+
+@pytest.mark.parametrize("rows", CORPUS_SIZES)
+def test_corpus_covers_metadata_shapes(corpus_records, rows):
+    valid = [record.metadata["attributes"] for record in corpus_records(rows) if record.kind == "valid"]
+    kinds = {record.kind for record in corpus_records(rows)}
+
+    assert kinds == {"valid", "malformed", "null"}
+    # 著者・タグは単数の文字列と複数の配列の両方を含む
+    assert any(isinstance(a["authors"]["author"], str) for a in valid)
+    assert any(isinstance(a["authors"]["author"], list) for a in valid)
+    assert any(isinstance(a.get("content_tags", {}).get("tag"), str) for a in valid)
+    assert any(isinstance(a.get("content_tags", {}).get("tag"), list) for a in valid)
+    assert any("content_tags" not in a for a in valid)
+
+
+@pytest.mark.parametrize("rows", CORPUS_SIZES)
+@pytest.mark.parametrize("stage", list(STAGES))
+def test_extraction_stage(benchmark, corpus_db, corpus_records, measure_peak_rss, allocation_baselines, stage, rows):
+    db_path = corpus_db(rows)
+    prepare, run = STAGES[stage]
+    data = prepare(db_path)
+
+    benchmark.group = stage
+    result = benchmark.pedantic(run, args=(data,), rounds=5, iterations=1, warmup_rounds=1)
+    _check_result(stage, result, corpus_records(rows))
+
+    allocations = measure_allocations(stage, db_path)
+    rss = measure_peak_rss(stage, db_path)
+
+    alloc_per_row = allocations["peak_bytes"] / rows
+    benchmark.extra_info.update({
+        "rows": rows,
+        "alloc_peak_bytes_per_row": round(alloc_per_row, 1),
+        "retained_blocks_per_row": round(allocations["retained_blocks"] / rows, 2),
+        "peak_rss_mb": round(rss["peak_rss_bytes"] / 2**20, 1),
+        "peak_rss_delta_mb": round(rss["peak_rss_delta_bytes"] / 2**20, 1),
+    })
+    if benchmark.stats is not None:
+        benchmark.extra_info["rows_per_sec"] = round(rows / benchmark.stats.stats.mean, 1)
+
+    key = f"{stage}[{rows}]"
+    if os.getenv("KINDLE_BENCH_UPDATE_BASELINES") == "1":
+        allocation_baselines[key] = {"alloc_peak_bytes_per_row": round(alloc_per_row, 1)}
+        return
+
+    baseline = allocation_baselines.get(key)
+    if baseline is None:
+        pytest.skip(f"{key} のベースラインがありません。KINDLE_BENCH_UPDATE_BASELINES=1 で作成してください。")
+
+    limit = baseline["alloc_peak_bytes_per_row"] * (1 + ALLOCATION_TOLERANCE)
+    assert alloc_per_row <= limit, (
+        f"{key}: 1行あたりのメモリ確保量 {alloc_per_row:.1f}B がベースライン "
+        f"{baseline['alloc_peak_bytes_per_row']:.1f}B の許容範囲 ({limit:.1f}B) を超えました。"
+    )
@@ -1,17 +1,34 @@
+import argparse
 from src.kindle_data.processor import get_cleaned_kindle_data
+from src.kindle_data.snapshot import export_kindle_snapshot, load_kindle_snapshot
 from src.notion_integration.registrar import register_kindle_data_to_notion
 
 def main():
+    parser = argparse.ArgumentParser(description="Kindleの蔵書データを抽出し、Notionデータベースに登録します。")
+    parser.add_argument("--export-snapshot", type=str, help="抽出・整形したデータを保存するパス (.arrow / .parquet)。指定した場合はNotionへの登録を行いません。")
+    parser.add_argument("--from-snapshot", type=str, help="Kindleデータベースの代わりに読み込むスナップショットのパス")
+
+    args = parser.parse_args()
+
     print("Kindleデータ抽出とNotion登録を開始します。")
-    
-    # Kindleデータの抽出とクリーンアップ
-    kindle_df = get_cleaned_kindle_data()
 
-    if kindle_df is not None:
-        # Notionへの登録
-        register_kindle_data_to_notion(kindle_df)
+    if args.from_snapshot:
+        # 保存済みのスナップショットから読み込む（抽出処理は行わない）
+        kindle_df = load_kindle_snapshot(args.from_snapshot)
     else:
+        # Kindleデータの抽出とクリーンアップ
+        kindle_df = get_cleaned_kindle_data()
+
+    if kindle_df is None:
         print("Kindleデータの取得に失敗したため、Notionへの登録をスキップします。")
+        return
+
+    if args.export_snapshot:
+        export_kindle_snapshot(kindle_df, args.export_snapshot)
+        return
+
+    # Notionへの登録
+    register_kindle_data_to_notion(kindle_df)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -66,12 +66,15 @@ def extract_metadata_attributes(book_df: pd.DataFrame) -> pd.DataFrame:
 
     return book_df
 
-def get_cleaned_kindle_data():
+def get_cleaned_kindle_data(db_path=None):
     load_dotenv()
 
-    db_file = "data/BookData.sqlite"
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    db_absolute_path = os.path.join(script_dir, '..', '..', db_file)
+    if db_path is None:
+        db_file = "data/BookData.sqlite"
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        db_absolute_path = os.path.join(script_dir, '..', '..', db_file)
+    else:
+        db_absolute_path = os.path.abspath(db_path)
 
     print(f"データベースパス: {db_absolute_path}")
 
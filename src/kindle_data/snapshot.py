@@ -0,0 +1,114 @@
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from typing import Optional
+
+# クリーンアップ済みKindleデータのスナップショットのスキーマ
+# author / publisher / content_tag は値の重複が多いため辞書エンコードする
+SNAPSHOT_SCHEMA = pa.schema([
+    pa.field("title", pa.string()),
+    pa.field("author", pa.dictionary(pa.int32(), pa.string())),
+    pa.field("publisher", pa.dictionary(pa.int32(), pa.string())),
+    pa.field("asin", pa.string()),
+    pa.field("content_tag", pa.dictionary(pa.int32(), pa.string())),
+    pa.field("purchase_date", pa.timestamp("us", tz="UTC")),
+    pa.field("publication_date", pa.timestamp("us", tz="UTC")),
+])
+
+DATETIME_COLUMNS = ["purchase_date", "publication_date"]
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+def _to_snapshot_table(kindle_df: pd.DataFrame) -> pa.Table:
+    """
+    クリーンアップ済みのDataFrameをスナップショット用のArrowテーブルに変換する。
+
+    Args:
+        kindle_df: get_cleaned_kindle_dataが返すDataFrame
+
+    Returns:
+        pa.Table: SNAPSHOT_SCHEMAに従ったテーブル（存在しないカラムは除く）
+    """
+    df = kindle_df.copy()
+    for col in DATETIME_COLUMNS:
+        if col in df.columns:
+            # 値ごとに書式を判定し、先頭の値と異なる書式の日付も欠損させない
+            converted = pd.to_datetime(df[col], errors="coerce", utc=True, format="mixed")
+            lost = df[col].notna() & converted.isna()
+            if lost.any():
+                examples = ", ".join(repr(v) for v in df.loc[lost, col].head(3))
+                print(f"警告: {col}の{lost.sum()}件の値を日付として解釈できなかったため、欠損値として保存します (例: {examples})")
+            df[col] = converted
+
+    fields = [field for field in SNAPSHOT_SCHEMA if field.name in df.columns]
+    df = df[[field.name for field in fields]]
+    for field in fields:
+        if pa.types.is_string(field.type) or pa.types.is_dictionary(field.type):
+            # 数値やNaNが混在していても文字列カラムとして書き出せるように正規化する
+            df[field.name] = df[field.name].map(lambda v: str(v) if pd.notna(v) else None)
+
+    return pa.Table.from_pandas(df, schema=pa.schema(fields), preserve_index=False)
+
+
+def export_kindle_snapshot(kindle_df: pd.DataFrame, path: str) -> str:
+    """
+    クリーンアップ済みのKindleデータを列指向フォーマットで保存する。
+
+    拡張子が.parquet/.pqの場合はParquet、それ以外はArrow IPC(Feather v2)で保存する。
+    Arrow IPCはメモリマップしたファイルからArrowテーブルをゼロコピーで読み込めるよう非圧縮で書き出す。
+
+    Args:
+        kindle_df: get_cleaned_kindle_dataが返すDataFrame
+        path: 保存先のファイルパス
+
+    Returns:
+        str: 保存先のファイルパス
+    """
+    table = _to_snapshot_table(kindle_df)
+
+    output_dir = os.path.dirname(os.path.abspath(path))
+    os.makedirs(output_dir, exist_ok=True)
+
+    if path.lower().endswith(PARQUET_SUFFIXES):
+        pq.write_table(table, path)
+    else:
+        feather.write_feather(table, path, compression="uncompressed")
+
+    print(f"{table.num_rows}件のKindle蔵書データを'{path}'に保存しました。")
+    return path
+
+
+def load_kindle_snapshot(path: str) -> Optional[pd.DataFrame]:
+    """
+    export_kindle_snapshotで保存したスナップショットを読み込む。
+
+    Arrow IPCファイルはメモリマップしてArrowテーブルをゼロコピーで読み込み、Parquetは展開して読み込む。
+    ただし登録処理がpandasのDataFrameを前提としているため、最後のto_pandasで各カラムはコピーされる。
+    辞書エンコードされたカラムはpandasのcategory型として復元される。
+
+    Args:
+        path: スナップショットのファイルパス
+
+    Returns:
+        Optional[pd.DataFrame]: register_kindle_data_to_notionにそのまま渡せるDataFrame。
+            ファイルが存在しない、または読み込めない場合はNone
+    """
+    if not os.path.exists(path):
+        print(f"エラー: スナップショットファイルが見つかりません: {path}")
+        return None
+
+    try:
+        if path.lower().endswith(PARQUET_SUFFIXES):
+            table = pq.read_table(path, memory_map=True)
+        else:
+            with pa.memory_map(path, "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid as e:
+        print(f"エラー: スナップショットファイルを読み込めませんでした: {path} ({e})")
+        return None
+
+    df = table.to_pandas()
+    print(f"'{path}'から{len(df)}件のKindle蔵書データを読み込みました。")
+    return df
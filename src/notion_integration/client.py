@@ -34,8 +34,11 @@ def register_book_to_notion_page(notion_client, db_id, book_data, description, t
         "出版社": {"rich_text": [{"text": {"content": str(book_data.get("publisher", ""))}}]},
         "ASIN": {"rich_text": [{"text": {"content": str(book_data.get("asin", ""))}}]}
     }
-    if pd.notna(book_data.get("purchase_date")):
-        properties["購入日"] = {"date": {"start": str(book_data["purchase_date"])}};
+    purchase_date = book_data.get("purchase_date")
+    if pd.notna(purchase_date):
+        # スナップショットやPURCHASE_DATE_SINCEで日時型になった値もISO 8601形式で渡す
+        start = purchase_date.isoformat() if isinstance(purchase_date, pd.Timestamp) else str(purchase_date)
+        properties["購入日"] = {"date": {"start": start}};
     if tags:
         properties["タグ"] = {"multi_select": [{"name": tag} for tag in tags]}
     if book_type:
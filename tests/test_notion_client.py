@@ -0,0 +1,42 @@
+import pandas as pd
+
+from src.kindle_data.snapshot import export_kindle_snapshot, load_kindle_snapshot
+from src.notion_integration.client import register_book_to_notion_page
+
+
+class _StubPages:
+    def __init__(self):
+        self.requests = []
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+
+
+class _StubNotion:
+    def __init__(self):
+        self.pages = _StubPages()
+
+
+def _register(book_data):
+    notion = _StubNotion()
+    register_book_to_notion_page(notion, "db-id", book_data, None, [], None)
+    return notion.pages.requests[0]["properties"]
+
+
+def test_purchase_date_from_snapshot_is_iso8601(tmp_path):
+    path = str(tmp_path / "snapshot.arrow")
+    export_kindle_snapshot(pd.DataFrame({
+        "title": ["本A", "本B"],
+        "asin": ["B000000001", "B000000002"],
+        "purchase_date": ["2017-05-18T08:24:05+0000", None],
+    }), path)
+    rows = [row.to_dict() for _, row in load_kindle_snapshot(path).iterrows()]
+
+    assert _register(rows[0])["購入日"] == {"date": {"start": "2017-05-18T08:24:05+00:00"}}
+    assert "購入日" not in _register(rows[1])
+
+
+def test_purchase_date_string_is_passed_through():
+    properties = _register({"title": "本A", "purchase_date": "2017-05-18T08:24:05+0000"})
+
+    assert properties["購入日"] == {"date": {"start": "2017-05-18T08:24:05+0000"}}
@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.kindle_data.snapshot import export_kindle_snapshot, load_kindle_snapshot
+
+DICTIONARY_COLUMNS = ["author", "publisher", "content_tag"]
+DATETIME_COLUMNS = ["purchase_date", "publication_date"]
+
+
+@pytest.fixture(params=["snapshot.arrow", "snapshot.parquet"])
+def snapshot_path(request, tmp_path):
+    return str(tmp_path / request.param)
+
+
+def _cleaned_df():
+    return pd.DataFrame({
+        "title": ["本A", "本B", "本C"],
+        "author": ["著者A, 著者B", np.nan, "著者A, 著者B"],
+        "publisher": ["出版社X", "出版社X", None],
+        "asin": ["B000000001", "B000000002", None],
+        "content_tag": ["ebook", None, "sample"],
+        # 書式の異なる日付が混在していても欠損させない
+        "purchase_date": ["2023-01-01T10:00:00+0000", "2023-03-04", np.nan],
+        "publication_date": ["2020-01-01T00:00:00+0900", None, "March 2020"],
+    })
+
+
+def test_round_trip(snapshot_path):
+    export_kindle_snapshot(_cleaned_df(), snapshot_path)
+    df = load_kindle_snapshot(snapshot_path)
+
+    assert list(df.columns) == list(_cleaned_df().columns)
+    for col in DICTIONARY_COLUMNS:
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+    for col in DATETIME_COLUMNS:
+        assert isinstance(df[col].dtype, pd.DatetimeTZDtype)
+        assert str(df[col].dt.tz) == "UTC"
+
+    assert df["author"].tolist()[0] == "著者A, 著者B"
+    assert pd.isna(df["author"][1])
+    assert pd.isna(df["publisher"][2])
+    assert df["asin"].tolist() == ["B000000001", "B000000002", None]
+
+    assert df["purchase_date"].tolist()[:2] == [
+        pd.Timestamp("2023-01-01 10:00:00", tz="UTC"),
+        pd.Timestamp("2023-03-04", tz="UTC"),
+    ]
+    assert df["purchase_date"][2] is pd.NaT
+    assert df["publication_date"][0] == pd.Timestamp("2019-12-31 15:00:00", tz="UTC")
+    assert df["publication_date"][1] is pd.NaT
+    assert df["publication_date"][2] == pd.Timestamp("2020-03-01", tz="UTC")
+
+
+def test_round_trip_empty(snapshot_path):
+    export_kindle_snapshot(_cleaned_df().iloc[0:0], snapshot_path)
+    df = load_kindle_snapshot(snapshot_path)
+
+    assert len(df) == 0
+    for col in DICTIONARY_COLUMNS:
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+    for col in DATETIME_COLUMNS:
+        assert isinstance(df[col].dtype, pd.DatetimeTZDtype)
+
+
+def test_unparseable_date_is_reported(snapshot_path, capsys):
+    kindle_df = _cleaned_df()
+    kindle_df.loc[0, "purchase_date"] = "not a date"
+
+    export_kindle_snapshot(kindle_df, snapshot_path)
+
+    assert "purchase_dateの1件の値を日付として解釈できなかった" in capsys.readouterr().out
+    assert load_kindle_snapshot(snapshot_path)["purchase_date"][0] is pd.NaT
+
+
+def test_load_missing_file_returns_none(tmp_path, capsys):
+    assert load_kindle_snapshot(str(tmp_path / "missing.arrow")) is None
+    assert "見つかりません" in capsys.readouterr().out
+
+
+def test_load_corrupt_file_returns_none(snapshot_path, capsys):
+    with open(snapshot_path, "wb") as f:
+        f.write(b"not a snapshot")
+
+    assert load_kindle_snapshot(snapshot_path) is None
+    assert "読み込めませんでした" in capsys.readouterr().out